@@ -83,6 +83,41 @@ class Node:
             The metadata text for the node.
     """
 
+    # Large files can produce tens of thousands of nodes so avoid a per
+    # instance __dict__
+    __slots__ = (
+        "name",
+        "filepath",
+        "path",
+        "print_path",
+        "children",
+        "parent",
+        "depth",
+        "obj_type",
+        "is_group",
+        "is_dataset",
+        "nr_child",
+        "has_children",
+        "attrs",
+        "nr_attrs",
+        "has_attrs",
+        "shape",
+        "size",
+        "datatype",
+        "compression",
+        "compression_opts",
+        "chunks",
+        "is_chunked",
+        "n_chunks",
+        "fillvalue",
+        "nbytes",
+        "ndim",
+        "_attr_text",
+        "_meta_text",
+        "is_under_cursor",
+        "is_highlighted",
+    )
+
     def __init__(self, name, obj, filepath, parent=None):
         """
         Initialise the Node.
@@ -138,26 +173,29 @@ class Node:
 
         # Does this node have children?
         if self.is_group:
-            self.nr_child = len(obj.keys())
+            self.nr_child = len(obj)
             self.has_children = bool(self.nr_child > 0)
         else:
             self.nr_child = 0
             self.has_children = False
 
-        # Does this node have attributes?
-        self.nr_attrs = len(obj.attrs.keys())
+        # Does this node have attributes? (every access to obj.attrs builds a
+        # new AttributeManager so read them all in a single pass)
+        self.attrs = dict(obj.attrs.items())
+        self.nr_attrs = len(self.attrs)
         self.has_attrs = bool(self.nr_attrs > 0)
-        self.attrs = {key: obj.attrs[key] for key in obj.attrs.keys()}
 
-        # For a dataset we can get a bunch of metadata to display
+        # For a dataset we can get a bunch of metadata to display (each of
+        # these properties queries the file so only ask for them once)
         if self.is_dataset:
             self.shape = obj.shape
             self.size = obj.size
             self.datatype = str(obj.dtype)
             self.compression = obj.compression
             self.compression_opts = obj.compression_opts
-            self.chunks = obj.chunks if obj.chunks is not None else obj.shape
-            self.is_chunked = obj.chunks != obj.shape
+            chunks = obj.chunks
+            self.chunks = chunks if chunks is not None else self.shape
+            self.is_chunked = chunks != self.shape
             self.n_chunks = (
                 1
                 if not self.is_chunked
@@ -247,8 +285,10 @@ class Node:
 
         with h5py.File(self.filepath, "r") as hdf:
             if self.nr_child > 0:
-                for key in hdf[self.path].keys():
-                    child = hdf[f"{self.path}/{key}"]
+                # Iterate over the group itself rather than looking up each
+                # child by its full path (which retraverses the file from
+                # the root for every child)
+                for key, child in hdf[self.path].items():
                     self.children.append(
                         Node(key, child, self.filepath, parent=self)
                     )
@@ -12,6 +12,8 @@ Example usage:
             bar.advance()
 """
 
+import time
+
 from h5forest.utils import get_window_size
 
 
@@ -36,6 +38,10 @@ class ProgressBar:
             The H5Forest instance to use for the progress bar.
         text_area (h5forest.h5_forest.TextArea):
             The text area to display the progress bar in.
+        min_interval (float):
+            The minimum time in seconds between redraws of the progress bar.
+        last_draw (float):
+            The time the progress bar was last redrawn.
     """
 
     def __init__(self, total, description=""):
@@ -55,6 +61,11 @@ class ProgressBar:
         self.forest = H5Forest()
         self.text_area = self.forest.progress_bar_content
 
+        # Limit redraws to ~20 per second, chunked reductions can advance
+        # the bar far more often than the eye can see
+        self.min_interval = 1 / 20
+        self.last_draw = 0.0
+
         self.forest.flag_progress_bar = True
 
     def update_progress(self, step):
@@ -68,6 +79,16 @@ class ProgressBar:
         # Increment the step
         self.current_step += step
 
+        # Skip the redraw if we drew recently and haven't finished (the
+        # initial draw and the final draw always go through)
+        now = time.monotonic()
+        if (
+            0 < self.current_step < self.total_steps
+            and now - self.last_draw < self.min_interval
+        ):
+            return
+        self.last_draw = now
+
         # Define the text that'll appear at the end
         back = (
             f"{self.current_step/self.total_steps * 100:.2f}% "
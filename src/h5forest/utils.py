@@ -1,6 +1,6 @@
 """A module containing utility functions and classes for the HDF5 viewer."""
 
-import os
+import shutil
 
 
 class DynamicTitle:
@@ -40,8 +40,12 @@ def get_window_size():
     """
     Get the terminal window size in lines and characters.
 
+    This queries the terminal directly rather than spawning a subprocess
+    (e.g. `stty size`), which matters since this is called every time a
+    progress bar is created.
+
     Returns:
         tuple: The number of lines and characters in the terminal window.
     """
-    rows, columns = os.popen("stty size", "r").read().split()
-    return int(rows), int(columns)
+    size = shutil.get_terminal_size()
+    return size.lines, size.columns